@@ -1,15 +1,12 @@
 import faiss # type: ignore
 import os
 import numpy as np
-from sentence_transformers import SentenceTransformer # type: ignore
 from database import fetch_volunteers, fetch_events
+from encoder import encode
 
-# Load the sentence transformer model
-model = SentenceTransformer("all-MiniLM-L6-v2")  # Open-source, works locally
-
-# Function to generate embeddings
+# Function to generate embeddings (backend set by EMBEDDING_BACKEND)
 def generate_embeddings(texts):
-    return model.encode(texts, convert_to_numpy=True)
+    return encode(texts)
 
 # Fetch volunteers & events
 volunteers = fetch_volunteers()
@@ -0,0 +1,102 @@
+import os
+from functools import lru_cache
+import numpy as np
+from sentence_transformers import SentenceTransformer  # type: ignore
+from dotenv import load_dotenv  # type: ignore
+
+load_dotenv()
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+# "fp32" (default) keeps the original full-precision model.
+# "int8" applies PyTorch dynamic quantization to the Linear layers for faster CPU inference.
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "fp32").lower()
+BACKENDS = ("fp32", "int8")
+
+##############################################
+# Encoder Loading
+##############################################
+
+@lru_cache(maxsize=None)
+def get_encoder(backend=EMBEDDING_BACKEND):
+    """Load the sentence transformer for the given backend (cached per process)."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown EMBEDDING_BACKEND '{backend}', expected one of {BACKENDS}")
+
+    if backend == "int8":
+        import torch  # type: ignore
+        # Dynamic quantization only runs on CPU
+        model = SentenceTransformer(MODEL_NAME, device="cpu")
+        torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    else:
+        model = SentenceTransformer(MODEL_NAME)
+
+    print(f"✅ Loaded {MODEL_NAME} encoder ({backend}).")
+    return model
+
+def encode(texts, backend=EMBEDDING_BACKEND):
+    """Encode texts with the configured backend, returning a float32 numpy array."""
+    embeddings = get_encoder(backend).encode(texts, convert_to_numpy=True)
+    return embeddings.astype(np.float32, copy=False)
+
+##############################################
+# Accuracy Report (int8 vs fp32)
+##############################################
+
+SAMPLE_QUERIES = [
+    "Which volunteers know sign language?",
+    "Events happening in Bangalore",
+    "Volunteers interested in teaching",
+    "Pending tasks for the sports event",
+    "Who is available on weekends?",
+    "Tasks that need photography skills",
+    "Completed task assignments",
+    "Fundraising events for visually impaired students",
+]
+
+def _normalize(x):
+    return x / np.clip(np.linalg.norm(x, axis=1, keepdims=True), 1e-12, None)
+
+def _cosine_agreement(a, b):
+    return np.sum(_normalize(a) * _normalize(b), axis=1)
+
+def _top_k(corpus_embeddings, query_embeddings, k):
+    import faiss  # type: ignore
+    index = faiss.IndexFlatL2(corpus_embeddings.shape[1])
+    index.add(corpus_embeddings)
+    _, I = index.search(query_embeddings, k)
+    return I
+
+def compare_backends(texts, queries, backend="int8", k=3):
+    """Compare a backend against fp32 on the same corpus and queries.
+
+    Returns the mean/min cosine similarity between the two embeddings of each text
+    and of each query, and the recall@k of the backend's FAISS results against the
+    fp32 results.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+
+    ref_docs = encode(texts, "fp32")
+    new_docs = encode(texts, backend)
+    ref_queries = encode(queries, "fp32")
+    new_queries = encode(queries, backend)
+    cosines = _cosine_agreement(ref_docs, new_docs)
+    query_cosines = _cosine_agreement(ref_queries, new_queries)
+
+    k = min(k, len(texts))
+    ref_hits = _top_k(ref_docs, ref_queries, k)
+    new_hits = _top_k(new_docs, new_queries, k)
+    recalls = [len(set(r) & set(n)) / k for r, n in zip(ref_hits, new_hits)]
+
+    return {
+        "backend": backend,
+        "num_texts": len(texts),
+        "num_queries": len(queries),
+        "k": k,
+        "cosine_mean": float(cosines.mean()),
+        "cosine_min": float(cosines.min()),
+        "query_cosine_mean": float(query_cosines.mean()),
+        "query_cosine_min": float(query_cosines.min()),
+        "recall": float(np.mean(recalls)),
+    }
@@ -1,20 +1,11 @@
+import sys
 import faiss
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from database import fetch_events, fetch_volunteers, fetch_tasks, fetch_task_assignments
+from encoder import encode, compare_backends, SAMPLE_QUERIES, BACKENDS
 
-# Load model
-model = SentenceTransformer("all-MiniLM-L6-v2")
-
-def update_faiss_index():
-    print("🔄 Updating FAISS index with fresh data...")
-
-    # Fetch data
-    volunteers = fetch_volunteers()
-    events = fetch_events()
-    tasks = fetch_tasks()
-    task_assignments = fetch_task_assignments()
-
+def build_corpus(volunteers, events, tasks, task_assignments):
+    """Build the texts to embed and their matching FAISS IDs."""
     all_data = []
     all_ids = []
 
@@ -67,8 +58,21 @@ def update_faiss_index():
         all_data.append(text)
         all_ids.append(f"assign_{assignment_id}")  # Prefix "assign_"
 
+    return all_data, all_ids
+
+def update_faiss_index():
+    print("🔄 Updating FAISS index with fresh data...")
+
+    # Fetch data
+    volunteers = fetch_volunteers()
+    events = fetch_events()
+    tasks = fetch_tasks()
+    task_assignments = fetch_task_assignments()
+
+    all_data, all_ids = build_corpus(volunteers, events, tasks, task_assignments)
+
     # Convert to embeddings
-    embeddings = model.encode(all_data, convert_to_numpy=True)
+    embeddings = encode(all_data)
 
     # Create FAISS index
     new_index = faiss.IndexFlatL2(embeddings.shape[1])
@@ -80,6 +84,35 @@ def update_faiss_index():
 
     print(f"✅ FAISS index updated! Volunteers: {len(volunteers)}, Events: {len(events)}, Tasks: {len(tasks)}, Assignments: {len(task_assignments)}")
 
+def report_backend_accuracy(backend, queries=None):
+    """Print how closely a backend's embeddings and FAISS results match fp32."""
+    if backend not in BACKENDS:
+        print(f"❌ Unknown backend '{backend}'. Choose one of: {', '.join(BACKENDS)}")
+        return None
+
+    texts, _ = build_corpus(fetch_volunteers(), fetch_events(), fetch_tasks(), fetch_task_assignments())
+    if not texts:
+        print("⚠️ No data to compare on.")
+        return None
+
+    report = compare_backends(texts, queries or SAMPLE_QUERIES, backend)
+    print(f"📊 {backend} vs fp32 on {report['num_texts']} texts / {report['num_queries']} queries:")
+    print(f"   - Text cosine agreement: mean {report['cosine_mean']:.4f}, min {report['cosine_min']:.4f}")
+    print(f"   - Query cosine agreement: mean {report['query_cosine_mean']:.4f}, min {report['query_cosine_min']:.4f}")
+    print(f"   - Retrieval recall@{report['k']}: {report['recall']:.3f}")
+    return report
+
+USAGE = "Usage: python faiss_updater.py [--compare [backend] [\"query 1\" \"query 2\" ...]]"
+
 # Run directly
 if __name__ == "__main__":
-    update_faiss_index()
+    args = sys.argv[1:]
+    if not args:
+        update_faiss_index()
+    elif args[0] == "--compare":
+        backend = args[1] if len(args) > 1 else "int8"
+        if report_backend_accuracy(backend, args[2:]) is None:
+            sys.exit(1)
+    else:
+        print(USAGE)
+        sys.exit(2)
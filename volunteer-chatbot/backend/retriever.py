@@ -3,7 +3,6 @@ from fastapi.middleware.cors import CORSMiddleware
 import faiss
 import numpy as np
 import os
-from sentence_transformers import SentenceTransformer
 from pydantic import BaseModel
 import google.generativeai as genai
 from dateutil import parser
@@ -12,6 +11,7 @@ from datetime import datetime
 from database import get_assigned_tasks
 from database import fetch_volunteers, fetch_events, fetch_tasks, fetch_task_assignments
 from database import get_tasks_for_volunteer
+from encoder import encode
 
 # Initialize FastAPI
 app = FastAPI()
@@ -25,9 +25,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load sentence transformer model
-model = SentenceTransformer("all-MiniLM-L6-v2")
-
 # Globals for FAISS and data
 index = None
 ids = None
@@ -204,7 +201,7 @@ def search(
     volunteer_id: str = None  # <-- Add this line
 ):
 
-    query_embedding = model.encode([query], convert_to_numpy=True)
+    query_embedding = encode([query])
     matched_ids = []
 
     # MONTH DETECTION